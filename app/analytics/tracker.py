@@ -1,33 +1,146 @@
-import sqlite3, time, os, json, threading, requests
+import sqlite3, time, os, threading, queue, atexit, requests
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from requests.adapters import HTTPAdapter
 
 DB_PATH = Path(__file__).parent.parent / 'analytics.db'
 DB_PATH = str(DB_PATH)
 
+# Writer batching: flush after BATCH_SIZE events or FLUSH_INTERVAL seconds, whichever first
+BATCH_SIZE = 100
+FLUSH_INTERVAL = 0.05
+# Give up on a locked database after this many seconds (matches busy_timeout)
+WRITE_RETRY_MAX = 5.0
+
 def init_db():
-    conn = sqlite3.connect(DB_PATH)
+    conn = sqlite3.connect(DB_PATH, isolation_level=None)
     cur = conn.cursor()
-    cur.execute("""CREATE TABLE IF NOT EXISTS events (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        event_type TEXT,
-        payload TEXT,
-        created_at INTEGER
-    )""")
-    conn.commit(); conn.close()
+    try:
+        # Whole setup in one write transaction: workers starting together serialize here,
+        # so only the first one to see events_summary missing creates and backfills it
+        cur.execute('BEGIN IMMEDIATE')
+        cur.execute("""CREATE TABLE IF NOT EXISTS events (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            event_type TEXT,
+            payload BLOB,
+            created_at INTEGER
+        )""")
+        cur.execute('CREATE INDEX IF NOT EXISTS idx_events_type_created ON events(event_type, created_at)')
+        # Per-type running totals, maintained by the writer so query_summary never scans events
+        has_summary = cur.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name='events_summary'").fetchone()
+        cur.execute("""CREATE TABLE IF NOT EXISTS events_summary (
+            event_type TEXT PRIMARY KEY,
+            cnt INTEGER,
+            first_ts INTEGER,
+            last_ts INTEGER
+        )""")
+        if not has_summary:
+            cur.execute('INSERT INTO events_summary SELECT event_type, COUNT(*), MIN(created_at), MAX(created_at) '
+                        'FROM events GROUP BY event_type')
+        cur.execute('COMMIT')
+    except Exception:
+        if conn.in_transaction: cur.execute('ROLLBACK')
+        raise
+    finally:
+        conn.close()
+
+@lru_cache(maxsize=1)
+def _ensure_db():
+    init_db()
 
-init_db()
+# Single long-lived writer connection; all inserts go through the background writer thread.
+# Both are created on the first recorded event, not at import.
+_conn = None
+_writer = None
+_writer_lock = threading.Lock()
+_event_queue: "queue.Queue" = queue.Queue()
+# Readers use their own read-only connections (one per thread) so they never take the write lock
+_read_local = threading.local()
+_STOP = object()
 
 GA4_MEASUREMENT_ID = os.getenv('GA4_MEASUREMENT_ID', '')
 GA4_API_SECRET = os.getenv('GA4_API_SECRET', '')
 GA4_CLIENT_ID = 'vedic_demo_client'
 
+# One pooled session keeps the TLS connection to GA alive; a small pool does the sends
+_GA_SESSION = requests.Session()
+_GA_SESSION.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=4))
+_GA_EXEC = ThreadPoolExecutor(max_workers=2, thread_name_prefix='ga-send')
+
+_SUMMARY_UPSERT = ('INSERT INTO events_summary (event_type,cnt,first_ts,last_ts) VALUES (?,?,?,?) '
+                   'ON CONFLICT(event_type) DO UPDATE SET cnt=cnt+excluded.cnt, '
+                   'first_ts=MIN(first_ts,excluded.first_ts), last_ts=MAX(last_ts,excluded.last_ts)')
+
+def _summarize(items):
+    agg = {}
+    for event_type, _, ts in items:
+        a = agg.get(event_type)
+        if a is None: agg[event_type] = [1, ts, ts]
+        else: a[0] += 1; a[1] = min(a[1], ts); a[2] = max(a[2], ts)
+    return [(t, c, f, l) for t, (c, f, l) in agg.items()]
+
+def _write_batch(items):
+    if not items: return
+    # Take the write lock up front (no deferred upgrade); back off while another writer holds it
+    delay, waited = 0.05, 0.0
+    while True:
+        try:
+            _conn.execute('BEGIN IMMEDIATE')
+            _conn.executemany('INSERT INTO events (event_type,payload,created_at) VALUES (?,?,?)', items)
+            _conn.executemany(_SUMMARY_UPSERT, _summarize(items))
+            _conn.execute('COMMIT')
+            return
+        except sqlite3.OperationalError as e:
+            if _conn.in_transaction: _conn.execute('ROLLBACK')
+            if 'locked' not in str(e) or waited >= WRITE_RETRY_MAX:
+                print('Analytics write error:', e); return
+            time.sleep(delay); waited += delay
+            delay = min(delay * 2, 1.0)
+        except Exception as e:
+            if _conn.in_transaction: _conn.execute('ROLLBACK')
+            print('Analytics write error:', e); return
+
+def _writer_loop():
+    while True:
+        item = _event_queue.get()
+        if item is _STOP: return
+        items = [item]
+        deadline = time.monotonic() + FLUSH_INTERVAL
+        stop = False
+        while len(items) < BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0: break
+            try: item = _event_queue.get(timeout=remaining)
+            except queue.Empty: break
+            if item is _STOP:
+                stop = True; break
+            items.append(item)
+        _write_batch(items)
+        if stop: return
+
+def _start_writer():
+    global _conn, _writer
+    with _writer_lock:
+        if _writer is not None: return
+        _ensure_db()
+        _conn = sqlite3.connect(DB_PATH, check_same_thread=False, isolation_level=None)
+        _conn.executescript("PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL; PRAGMA busy_timeout=5000; "
+                            "PRAGMA temp_store=memory; PRAGMA cache_size=-20000;")
+        writer = threading.Thread(target=_writer_loop, name='analytics-writer', daemon=True)
+        writer.start()
+        atexit.register(_flush_on_exit)
+        _writer = writer
+
+def _flush_on_exit():
+    _event_queue.put(_STOP)
+    _writer.join(timeout=5)
+
 def record_event(event_type: str, payload: dict):
     try:
-        conn = sqlite3.connect(DB_PATH)
-        cur = conn.cursor()
-        cur.execute('INSERT INTO events (event_type,payload,created_at) VALUES (?,?,?)',
-                    (event_type, json.dumps(payload), int(time.time())))
-        conn.commit(); conn.close()
+        if _writer is None: _start_writer()
+        _event_queue.put((event_type, orjson.dumps(payload), int(time.time())))
     except Exception as e:
         print('Analytics write error:', e)
 
@@ -35,18 +148,26 @@ def _send_to_ga(event_type, payload):
     if not GA4_MEASUREMENT_ID or not GA4_API_SECRET: return
     url = f'https://www.google-analytics.com/mp/collect?measurement_id={GA4_MEASUREMENT_ID}&api_secret={GA4_API_SECRET}'
     data = {'client_id': GA4_CLIENT_ID, 'events': [{'name': event_type, 'params': payload}]}
-    try: requests.post(url, json=data, timeout=2)
+    try: _GA_SESSION.post(url, json=data, timeout=2)
     except Exception as e: print('GA send error:', e)
 
 def record_event_with_ga(event_type: str, payload: dict):
     record_event(event_type, payload)
-    threading.Thread(target=_send_to_ga, args=(event_type, payload), daemon=True).start()
+    _GA_EXEC.submit(_send_to_ga, event_type, payload)
+
+def _read_conn():
+    conn = getattr(_read_local, 'conn', None)
+    if conn is None:
+        _ensure_db()
+        conn = sqlite3.connect(f'file:{DB_PATH}?mode=ro', uri=True)
+        _read_local.conn = conn
+    return conn
 
 def query_summary():
-    conn = sqlite3.connect(DB_PATH); cur = conn.cursor()
-    cur.execute('SELECT COUNT(*), MIN(created_at), MAX(created_at) FROM events')
+    cur = _read_conn().cursor()
+    cur.execute('SELECT SUM(cnt), MIN(first_ts), MAX(last_ts) FROM events_summary')
     total, first_ts, last_ts = cur.fetchone()
-    cur.execute('SELECT event_type, COUNT(*) FROM events GROUP BY event_type')
+    cur.execute('SELECT event_type, cnt FROM events_summary ORDER BY event_type')
     by_type = cur.fetchall()
-    conn.close()
+    cur.close()
     return {'total_events': total or 0, 'first_ts': first_ts, 'last_ts': last_ts, 'by_type': by_type}
@@ -1,10 +1,13 @@
 # app/astrology/engine.py
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import accumulate
 from typing import Dict, Any, List, Tuple, Optional
 from datetime import datetime, timezone, timedelta
-import math
+import bisect
+import threading
 
 import swisseph as sw
 
@@ -13,22 +16,34 @@ import swisseph as sw
 ENGINE_VERSION = "kp-ephem-1.0"
 
 # --- Sidereal mode: KP (Krishnamurti); fall back if not present ---
-try:
-    KP_CONST = getattr(sw, "SIDM_KRISHNAMURTI", None) or getattr(sw, "SIDM_KP", None)
-    if KP_CONST is None:
-        # last-resort fallback so import never crashes
-        KP_CONST = sw.SIDM_LAHIRI
-    sw.set_sid_mode(KP_CONST)
-except Exception as e:
-    # Never crash on import; default to Lahiri if anything odd happens
+def _set_sid_mode() -> None:
     try:
-        sw.set_sid_mode(sw.SIDM_LAHIRI)
-    except Exception:
-        pass
+        kp_const = getattr(sw, "SIDM_KRISHNAMURTI", None) or getattr(sw, "SIDM_KP", None)
+        if kp_const is None:
+            # last-resort fallback so import never crashes
+            kp_const = sw.SIDM_LAHIRI
+        sw.set_sid_mode(kp_const)
+    except Exception as e:
+        # Never crash on import; default to Lahiri if anything odd happens
+        try:
+            sw.set_sid_mode(sw.SIDM_LAHIRI)
+        except Exception:
+            pass
+
+# Swiss Ephemeris keeps the sidereal mode per thread, so request worker threads
+# must set it themselves before their first calculation.
+_sid_local = threading.local()
+
+def _ensure_sid_mode() -> None:
+    if not getattr(_sid_local, "ready", False):
+        _set_sid_mode()
+        _sid_local.ready = True
+
+_ensure_sid_mode()
 FLAGS = sw.FLG_MOSEPH | sw.FLG_SPEED | sw.FLG_SIDEREAL
 
 # Vimśottarī sequence (9 lords, 120 years total)
-VIM_SEQUENCE = ["ketu", "venus", "sun", "moon", "mars", "rahu", "jupiter", "saturn", "mercury"]
+VIM_SEQUENCE = ("ketu", "venus", "sun", "moon", "mars", "rahu", "jupiter", "saturn", "mercury")
 VIM_DURATIONS_YEARS: Dict[str, float] = {
     "ketu": 7.0,
     "venus": 20.0,
@@ -54,11 +69,12 @@ PLANETS = {
     "rahu": sw.MEAN_NODE,
     "ketu": sw.MEAN_NODE,  # will be rahu + 180
 }
+_EPHEM_BODIES = tuple(name for name in PLANETS if name != "ketu")
 
-SIGNS = [
+SIGNS = (
     "Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo",
     "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"
-]
+)
 
 RULERS = {
     "Aries": "mars", "Taurus": "venus", "Gemini": "mercury", "Cancer": "moon",
@@ -66,23 +82,48 @@ RULERS = {
     "Sagittarius": "jupiter", "Capricorn": "saturn", "Aquarius": "saturn", "Pisces": "jupiter"
 }
 
+# Positional views of the tables above for hot paths: index by sign / sequence position, not by name
+_SIGN_RULERS: Tuple[str, ...] = tuple(RULERS[s] for s in SIGNS)
+_VIM_YEARS: Tuple[float, ...] = tuple(VIM_DURATIONS_YEARS[p] for p in VIM_SEQUENCE)
+
 NAK_SPAN_DEG = 360.0 / 27.0  # 13°20'
+_INV_NAK_SPAN = 27.0 / 360.0
+
+# Sub-lord tables, one per star-lord rotation: (cumulative end fractions, lords)
+def _build_sub_tables() -> List[Tuple[Tuple[float, ...], Tuple[str, ...]]]:
+    tables = []
+    for idx0 in range(9):
+        seq = tuple(VIM_SEQUENCE[(idx0 + i) % 9] for i in range(9))
+        ends, cum = [], 0.0
+        for p in seq:
+            cum += VIM_DURATIONS_YEARS[p] / VIM_TOTAL_YEARS
+            ends.append(cum)
+        tables.append((tuple(ends), seq))
+    return tables
+
+_SUB_TABLES = _build_sub_tables()
+
+# (lord, share of the parent period) in Vimśottarī order, rotated to start at each lord
+_ROTATED_FRACS: Dict[str, Tuple[Tuple[str, float], ...]] = {
+    VIM_SEQUENCE[i]: tuple(
+        (VIM_SEQUENCE[(i + k) % 9], VIM_DURATIONS_YEARS[VIM_SEQUENCE[(i + k) % 9]] / VIM_TOTAL_YEARS)
+        for k in range(9)
+    )
+    for i in range(9)
+}
 
 # ───────────────────────── Utilities ─────────────────────────
 
-def _scalar(v) -> float:
-    """Flatten nested lists/tuples until a scalar; then to float."""
-    while isinstance(v, (list, tuple)) and len(v) > 0:
-        v = v[0]
-    return float(v)
-
+# Python's % with a positive modulus is already non-negative, so hot paths
+# normalize inline with `x % 360.0` instead of calling normalize_deg.
 def normalize_deg(x) -> float:
-    x = float(x) % 360.0
-    return x + 360.0 if x < 0 else x
+    return float(x) % 360.0
+
+def _sign_index(lon: float) -> int:
+    return int((lon % 360.0) / 30.0)  # non-negative, so truncation is floor
 
 def sign_from_longitude(lon) -> str:
-    lon = normalize_deg(lon)
-    return SIGNS[int(math.floor(lon / 30.0))]
+    return SIGNS[_sign_index(lon)]
 
 def jd_from_datetime(dt: datetime) -> float:
     return dt.timestamp() / 86400.0 + 2440587.5
@@ -91,20 +132,38 @@ def datetime_from_jd(jd: float) -> datetime:
     ts = (jd - 2440587.5) * 86400.0
     return datetime.fromtimestamp(ts, tz=timezone.utc)
 
+@lru_cache(maxsize=4096)
+def _iso_from_jd(jd: float) -> str:
+    # adjacent periods share exact boundary JDs, so each boundary is formatted once
+    return datetime_from_jd(jd).isoformat()
+
 def calc_lon(jd_ut: float, body: int) -> float:
     """Swiss Ephemeris ecliptic longitude (sidereal) 0..360."""
-    pos = sw.calc_ut(jd_ut, body, FLAGS)
-    return normalize_deg(_scalar(pos))
-
-def _arc(a: float, b: float) -> float:
-    """Forward arc a→b in [0,360)."""
-    return (normalize_deg(b) - normalize_deg(a)) % 360.0
+    return _calc_lon_cached(float(jd_ut), int(body))
+
+@lru_cache(maxsize=4096)
+def _calc_lon_cached(jd_ut: float, body: int) -> float:
+    # FLAGS and sidereal mode are fixed, so (jd_ut, body) fully determines the result
+    _ensure_sid_mode()
+    # calc_ut -> ((lon, lat, dist, speeds...), retflag)
+    return sw.calc_ut(jd_ut, body, FLAGS)[0][0] % 360.0
+
+def calc_lons(jd_ut: float) -> Dict[str, float]:
+    """All PLANETS longitudes at jd_ut in one pass; Ketu is derived from Rahu, not recomputed."""
+    longs = dict(zip(_EPHEM_BODIES, _calc_lons_cached(float(jd_ut))))
+    longs["ketu"] = (longs["rahu"] + 180.0) % 360.0
+    return longs
+
+@lru_cache(maxsize=1024)
+def _calc_lons_cached(jd_ut: float) -> Tuple[float, ...]:
+    # one cache entry per JD instead of one per (JD, body); callers get a fresh dict each time
+    return tuple(_calc_lon_cached(jd_ut, PLANETS[name]) for name in _EPHEM_BODIES)
 
 # ───────────────────────── KP: star-lord / sub-lord / houses ─────────────────────────
 
 def star_lord_at(lon: float) -> str:
     """Nakshatra lord at longitude (sidereal)."""
-    idx = int(normalize_deg(lon) // NAK_SPAN_DEG)
+    idx = int((lon % 360.0) // NAK_SPAN_DEG)
     return VIM_SEQUENCE[idx % 9]
 
 def sub_lord_at(lon: float) -> str:
@@ -113,53 +172,48 @@ def sub_lord_at(lon: float) -> str:
     Split the 13°20' nakshatra by Vimśottarī proportions, BUT rotate the sequence
     so it starts at that nakshatra's star-lord (not always Ketu).
     """
-    lon = normalize_deg(lon)
-    n0 = int(lon // NAK_SPAN_DEG)
-    start_deg = n0 * NAK_SPAN_DEG
-    f = (lon - start_deg) / NAK_SPAN_DEG  # 0..1
-
-    star = VIM_SEQUENCE[n0 % 9]
-    idx0 = VIM_SEQUENCE.index(star)
-    seq = [VIM_SEQUENCE[(idx0 + i) % 9] for i in range(9)]
-
-    total = VIM_TOTAL_YEARS
-    cum = 0.0
-    for p in seq:
-        seg = VIM_DURATIONS_YEARS[p] / total
-        if cum <= f < cum + seg or abs(f - (cum + seg)) < 1e-12:
-            return p
-        cum += seg
-    return seq[-1]
-
-def house_num_of_lon(lon: float, cusps: List[float]) -> int:
+    return sub_lords_at((lon,))[0]
+
+def sub_lords_at(lons) -> List[str]:
+    """sub_lord_at for a batch of longitudes, with the lookup tables bound once."""
+    span, inv_span, tables, find = NAK_SPAN_DEG, _INV_NAK_SPAN, _SUB_TABLES, bisect.bisect_left
+    out = []
+    for lon in lons:
+        lon = lon % 360.0
+        n0 = int(lon // span)
+        f = (lon - n0 * span) * inv_span  # 0..1
+        # first segment whose end is >= f (an exact boundary belongs to the earlier lord)
+        ends, seq = tables[n0 % 9]
+        out.append(seq[min(find(ends, f - 1e-12), 8)])
+    return out
+
+def house_ends_from_cusps(cusps: List[float]) -> Tuple[float, ...]:
+    """
+    End of each house as a forward offset from cusp 1 (the last one is 360).
+    Cusps are in zodiac order, so the offsets are ascending and bisectable.
+    """
+    asc = cusps[0]
+    return tuple((c - asc) % 360.0 for c in cusps[1:12]) + (360.0,)
+
+def house_num_of_lon(lon: float, cusps: List[float], ends: Optional[Tuple[float, ...]] = None) -> int:
     """
     Return house number (1..12) containing longitude 'lon',
     given 12 cusp longitudes in zodiac order starting at 1.
+    Pass precomputed 'ends' (house_ends_from_cusps) to skip rebuilding them.
     """
-    lon = normalize_deg(lon)
-    for i in range(12):
-        a = cusps[i]
-        b = cusps[(i + 1) % 12]
-        # width of this house as forward arc
-        if i < 11:
-            width = _arc(a, b)
-        else:
-            width = 360.0 - sum(_arc(cusps[j], cusps[(j+1) % 12]) for j in range(11))
-        if _arc(a, lon) < width or abs(_arc(a, lon) - width) < 1e-12:
-            return i + 1
-    return 1
+    if ends is None:
+        ends = house_ends_from_cusps(cusps)
+    x = (lon - cusps[0]) % 360.0
+    # a longitude exactly on a cusp stays in the earlier house
+    return min(bisect.bisect_left(ends, x - 1e-12), 11) + 1
 
 def planet_owned_houses(natal: "NatalContext", planet: str) -> List[str]:
     """Houses where the cusp sign is ruled by 'planet'."""
-    out = []
-    for h, sign in natal.house_map.items():
-        if RULERS.get(sign, "") == planet.lower():
-            out.append(h)
-    return out
+    return list(natal.owned_houses.get(planet.lower(), ()))
 
 # ───────────────────────── Data classes ─────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class NatalContext:
     utc_birth_dt: datetime
     latitude: float
@@ -169,16 +223,34 @@ class NatalContext:
     planet_longitudes: Dict[str, float]
     house_map: Dict[str, str]             # sign on each house cusp
     house_cusps_deg: List[float]          # 12 cusp longitudes (deg)
+    house_ends: Tuple[float, ...] = ()    # house_ends_from_cusps(house_cusps_deg)
+    owned_houses: Dict[str, List[str]] = field(default_factory=dict)  # planet -> houses whose cusp sign it rules
+    planet_houses: Dict[str, str] = field(default_factory=dict)       # planet -> house it occupies
+    planet_lords: Dict[str, Tuple[str, str]] = field(default_factory=dict)  # planet -> (star-lord, sign-lord)
+    _significators: Optional[Dict[str, Dict[str, float]]] = field(default=None, init=False, repr=False, compare=False)
 
-@dataclass
+@dataclass(slots=True)
 class DashaPeriod:
     planet: str
     start_jd: float
     end_jd: float
-    start_iso: str
-    end_iso: str
-
-@dataclass
+    # ISO strings are formatted on first access; most periods are only compared by JD
+    _start_iso: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _end_iso: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def start_iso(self) -> str:
+        if self._start_iso is None:
+            self._start_iso = _iso_from_jd(self.start_jd)
+        return self._start_iso
+
+    @property
+    def end_iso(self) -> str:
+        if self._end_iso is None:
+            self._end_iso = _iso_from_jd(self.end_jd)
+        return self._end_iso
+
+@dataclass(slots=True)
 class DashaContext:
     maha: Optional[str]
     antara: Optional[str]
@@ -187,7 +259,7 @@ class DashaContext:
     window_to: str
     periods: List[DashaPeriod]
 
-@dataclass
+@dataclass(slots=True)
 class TransitContext:
     active: Dict[str, Any]
 
@@ -199,46 +271,58 @@ def compute_natal(birth) -> NatalContext:
       - utc_iso: ISO datetime string WITH timezone (UTC recommended)
       - latitude: float
       - longitude: float
+    Results are memoized per (utc_iso, lat, lon); the returned context is shared, treat it as read-only.
     """
     if not getattr(birth, "utc_iso", None):
         raise ValueError("birth.utc_iso is required (e.g., 1990-04-20T05:25:00+00:00)")
     if not hasattr(birth, "latitude") or not hasattr(birth, "longitude"):
         raise ValueError("birth.latitude and birth.longitude are required")
 
-    dt_utc = datetime.fromisoformat(birth.utc_iso).astimezone(timezone.utc)
+    return _compute_natal_cached(birth.utc_iso, round(float(birth.latitude), 6), round(float(birth.longitude), 6))
+
+@lru_cache(maxsize=1024)
+def _compute_natal_cached(utc_iso: str, latitude: float, longitude: float) -> NatalContext:
+    dt_utc = datetime.fromisoformat(utc_iso).astimezone(timezone.utc)
     jd_ut = jd_from_datetime(dt_utc)
 
     # Planet longitudes (sidereal)
-    longs: Dict[str, float] = {}
-    for name, const in PLANETS.items():
-        if name == "ketu":
-            rahu_lon = calc_lon(jd_ut, PLANETS["rahu"])
-            longs["ketu"] = normalize_deg(rahu_lon + 180.0)
-        else:
-            longs[name] = calc_lon(jd_ut, const)
+    longs = calc_lons(jd_ut)
 
     # House cusps (Placidus)
-    cusps_raw, _ascmc = sw.houses(jd_ut, float(birth.latitude), float(birth.longitude))
+    cusps_raw, _ascmc = sw.houses(jd_ut, latitude, longitude)
     cusps_list = list(cusps_raw)
     if len(cusps_list) >= 13 and abs(cusps_list[0]) < 1e-9:
         cusps_vals = cusps_list[1:13]
     else:
         cusps_vals = cusps_list[:12]
-    cusps = [normalize_deg(c) for c in cusps_vals]
+    cusps = [c % 360.0 for c in cusps_vals]
 
     asc_deg = cusps[0]
-    house_map = {str(i + 1): sign_from_longitude(cusps[i]) for i in range(12)}
+    cusp_signs = [_sign_index(c) for c in cusps]
+    house_map = {str(i + 1): SIGNS[k] for i, k in enumerate(cusp_signs)}
     moon_sign = sign_from_longitude(longs["moon"])
+    ends = house_ends_from_cusps(cusps)
+
+    # Reverse indexes used by the significator scoring: ownership and placement per planet
+    owned_houses: Dict[str, List[str]] = {p: [] for p in PLANETS}
+    for i, k in enumerate(cusp_signs):
+        owned_houses[_SIGN_RULERS[k]].append(str(i + 1))
+    planet_houses = {p: str(house_num_of_lon(lon, cusps, ends)) for p, lon in longs.items()}
+    planet_lords = {p: (star_lord_at(lon), _SIGN_RULERS[_sign_index(lon)]) for p, lon in longs.items()}
 
     return NatalContext(
         utc_birth_dt=dt_utc,
-        latitude=float(birth.latitude),
-        longitude=float(birth.longitude),
+        latitude=latitude,
+        longitude=longitude,
         ascendant_deg=asc_deg,
         moon_sign=moon_sign,
         planet_longitudes=longs,
         house_map=house_map,
         house_cusps_deg=cusps,
+        house_ends=ends,
+        owned_houses=owned_houses,
+        planet_houses=planet_houses,
+        planet_lords=planet_lords,
     )
 
 # ───────────────────────── Vimśottarī Dasha ─────────────────────────
@@ -246,9 +330,9 @@ def compute_natal(birth) -> NatalContext:
 def _moon_nakshatra_fraction(jd_ut: float) -> Tuple[int, float]:
     """Return (nakshatra_index 0..26, fraction 0..1 inside it)."""
     moon_lon = calc_lon(jd_ut, PLANETS["moon"])
-    idx = int(normalize_deg(moon_lon) // NAK_SPAN_DEG)
+    idx = int(moon_lon // NAK_SPAN_DEG)
     start = idx * NAK_SPAN_DEG
-    frac = (normalize_deg(moon_lon) - start) / NAK_SPAN_DEG
+    frac = (moon_lon - start) * _INV_NAK_SPAN
     return idx, frac
 
 def compute_vimshottari_dasha_for_birth(jd_ut: float) -> DashaContext:
@@ -257,40 +341,30 @@ def compute_vimshottari_dasha_for_birth(jd_ut: float) -> DashaContext:
     Build full 120-year ladder forward.
     """
     n_idx, frac = _moon_nakshatra_fraction(jd_ut)
-    first_lord = VIM_SEQUENCE[n_idx % 9]
-    remaining_years = VIM_DURATIONS_YEARS[first_lord] * (1.0 - frac)
+    i0 = n_idx % 9
+    first_lord = VIM_SEQUENCE[i0]
+    remaining_years = _VIM_YEARS[i0] * (1.0 - frac)
 
     ydays = 365.2425
-    periods: List[DashaPeriod] = []
-
-    # First partial maha
-    start = jd_ut
-    end = start + remaining_years * ydays
-    periods.append(DashaPeriod(
-        planet=first_lord.title(),
-        start_jd=start,
-        end_jd=end,
-        start_iso=datetime_from_jd(start).isoformat(),
-        end_iso=datetime_from_jd(end).isoformat(),
-    ))
-
-    # Continue through full cycle until ~120 years total
-    cur = end
-    seq_idx = (VIM_SEQUENCE.index(first_lord) + 1) % 9
-    max_jd = start + VIM_TOTAL_YEARS * ydays + 1.0  # guard
-    while cur < max_jd - 1e-6:
-        lord = VIM_SEQUENCE[seq_idx % 9]
-        span = VIM_DURATIONS_YEARS[lord] * ydays
-        nxt = cur + span
-        periods.append(DashaPeriod(
-            planet=lord.title(),
-            start_jd=cur,
-            end_jd=nxt,
-            start_iso=datetime_from_jd(cur).isoformat(),
-            end_iso=datetime_from_jd(nxt).isoformat(),
-        ))
-        cur = nxt
-        seq_idx += 1
+
+    # Two rotated cycles always cover 120 years after a partial first maha;
+    # period boundaries are a running sum from birth, the first span being the remainder.
+    order = [(i0 + k) % 9 for k in range(18)]
+    lords = [VIM_SEQUENCE[j] for j in order]
+    spans = [remaining_years * ydays] + [_VIM_YEARS[j] * ydays for j in order[1:]]
+    bounds = list(accumulate(spans, initial=jd_ut))
+
+    # Keep the first partial maha plus every period starting before ~120 years
+    max_jd = jd_ut + VIM_TOTAL_YEARS * ydays + 1.0  # guard
+    count = bisect.bisect_left(bounds, max_jd - 1e-6, 1, len(lords))
+    periods: List[DashaPeriod] = [
+        DashaPeriod(
+            planet=lords[i].title(),
+            start_jd=bounds[i],
+            end_jd=bounds[i + 1],
+        )
+        for i in range(count)
+    ]
 
     maha = periods[0].planet if periods else None
     antara = None
@@ -301,6 +375,37 @@ def compute_vimshottari_dasha_for_birth(jd_ut: float) -> DashaContext:
         periods=periods
     )
 
+class _PeriodRow(dict):
+    """
+    Subdivision row; 'start_iso'/'end_iso' are formatted from the JDs on first lookup.
+    """
+    __slots__ = ()
+    _ISO_KEYS = {"start_iso": "start_jd", "end_iso": "end_jd"}
+
+    def __missing__(self, key):
+        jd_key = self._ISO_KEYS.get(key)
+        if jd_key is None:
+            raise KeyError(key)
+        iso = self[key] = _iso_from_jd(self[jd_key])
+        return iso
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+def _split_period(start_jd: float, end_jd: float, lord: str) -> List[Tuple[str, float, float]]:
+    """
+    Child periods of [start_jd, end_jd] in Vimśottarī order starting at 'lord',
+    each sized by its year share; boundaries are one running sum from start_jd.
+    """
+    shares = _ROTATED_FRACS[lord]
+    length = end_jd - start_jd
+    bounds = list(accumulate((length * frac for _, frac in shares), initial=start_jd))
+    bounds[-1] = end_jd  # the shares sum to 1; absorb the rounding so children tile the parent exactly
+    return [(child, bounds[k], bounds[k + 1]) for k, (child, _) in enumerate(shares)]
+
 def subdivide_vimshottari(dasha_ctx, levels: int = 2) -> List[Dict[str, Any]]:
     """
     Split Maha → Antara → Pratyantara by Vimśottarī ratios (KP-correct):
@@ -310,15 +415,13 @@ def subdivide_vimshottari(dasha_ctx, levels: int = 2) -> List[Dict[str, Any]]:
     out: List[Dict[str, Any]] = []
 
     def add_block(level: str, lord: str, start_jd: float, end_jd: float, parent: Optional[str] = None):
-        out.append({
-            "level": level,
-            "lord": lord,
-            "parent": parent,  # for antara: maha lord; for pratyantara: antara lord
-            "start_jd": float(start_jd),
-            "end_jd": float(end_jd),
-            "start_iso": datetime_from_jd(start_jd).isoformat(),
-            "end_iso": datetime_from_jd(end_jd).isoformat(),
-        })
+        out.append(_PeriodRow(
+            level=level,
+            lord=lord,
+            parent=parent,  # for antara: maha lord; for pratyantara: antara lord
+            start_jd=float(start_jd),
+            end_jd=float(end_jd),
+        ))  # start_iso / end_iso filled in lazily
 
     for maha in getattr(dasha_ctx, "periods", []):
         m_lord = (maha.planet or "").lower()
@@ -328,38 +431,18 @@ def subdivide_vimshottari(dasha_ctx, levels: int = 2) -> List[Dict[str, Any]]:
             continue
 
         # ANTARA: rotate to start at MAHA lord
-        m_len = m_end - m_start
-        start_idx = VIM_SEQUENCE.index(m_lord)
-        antara_seq = [VIM_SEQUENCE[(start_idx + i) % 9] for i in range(9)]
-
-        cursor = m_start
-        for lord in antara_seq:
-            frac = VIM_DURATIONS_YEARS[lord] / VIM_TOTAL_YEARS
-            span = m_len * frac
-            a_start, a_end = cursor, min(cursor + span, m_end)
+        first = len(out)
+        for lord, a_start, a_end in _split_period(m_start, m_end, m_lord):
             add_block("antara", lord, a_start, a_end, parent=m_lord)
-            cursor = a_end
-            if cursor >= m_end - 1e-9:
-                break
+        antaras_here = out[first:]
 
         if levels < 3:
             continue
 
-        # PRATYANTARA: for each antara, rotate to start at that antara lord
-        for a in [x for x in out if x["level"] == "antara" and x["parent"] == m_lord and m_start - 1e-9 <= x["start_jd"] <= m_end + 1e-9]:
-            a_len = a["end_jd"] - a["start_jd"]
-            start_idx = VIM_SEQUENCE.index(a["lord"])
-            praty_seq = [VIM_SEQUENCE[(start_idx + i) % 9] for i in range(9)]
-
-            cursor = a["start_jd"]
-            for lord2 in praty_seq:
-                frac2 = VIM_DURATIONS_YEARS[lord2] / VIM_TOTAL_YEARS
-                span2 = a_len * frac2
-                p_start, p_end = cursor, min(cursor + span2, a["end_jd"])
+        # PRATYANTARA: for each antara of this maha, rotate to start at that antara lord
+        for a in antaras_here:
+            for lord2, p_start, p_end in _split_period(a["start_jd"], a["end_jd"], a["lord"]):
                 add_block("pratyantara", lord2, p_start, p_end, parent=a["lord"])
-                cursor = p_end
-                if cursor >= a["end_jd"] - 1e-9:
-                    break
 
     return out
 
@@ -367,10 +450,11 @@ def subdivide_vimshottari(dasha_ctx, levels: int = 2) -> List[Dict[str, Any]]:
 
 def compute_csl_for_houses(natal: "NatalContext") -> Dict[str, str]:
     """Cuspal Sub-Lords (CSL) for houses 1..12."""
-    csl: Dict[str, str] = {}
-    for i, cusp_lon in enumerate(natal.house_cusps_deg, start=1):
-        csl[str(i)] = sub_lord_at(cusp_lon)
-    return csl
+    return {str(i): lord for i, lord in enumerate(sub_lords_at(natal.house_cusps_deg), start=1)}
+
+def _add_weights(wmap: Dict[str, float], houses, w: float) -> None:
+    for h in houses:
+        wmap[h] = wmap.get(h, 0.0) + w
 
 def planet_significators(natal: "NatalContext") -> Dict[str, Dict[str, float]]:
     """
@@ -379,51 +463,40 @@ def planet_significators(natal: "NatalContext") -> Dict[str, Dict[str, float]]:
       2× planet's own placement + ownership,
       1× houses of planet's sign-lord (placement + ownership).
     Nodes already inherit via their star/sign packages implicitly.
+    Computed once per natal and shared; treat the result as read-only.
     """
+    if natal._significators is not None:
+        return natal._significators
+
     weights: Dict[str, Dict[str, float]] = {}
+    placed, owned = natal.planet_houses, natal.owned_houses
 
-    for p, p_lon in natal.planet_longitudes.items():
-        p = p.lower()
+    for p, (s_lord, sign_lord) in natal.planet_lords.items():
         wmap: Dict[str, float] = {}
 
-        # own placement house
-        p_house = str(house_num_of_lon(p_lon, natal.house_cusps_deg))
-
-        # own ownership houses
-        own_owned = planet_owned_houses(natal, p)
-
-        # star-lord & sign-lord
-        s_lord = star_lord_at(p_lon)
-        zsign = sign_from_longitude(p_lon)
-        sign_lord = RULERS.get(zsign, "")
-
-        def add(houses: List[str], w: float):
-            for h in houses:
-                wmap[h] = wmap.get(h, 0.0) + w
-
         # star-lord package (3×)
         if s_lord:
-            s_lon = natal.planet_longitudes.get(s_lord)
-            if s_lon is not None:
-                add([str(house_num_of_lon(s_lon, natal.house_cusps_deg))], 3.0)
-            add(planet_owned_houses(natal, s_lord), 3.0)
+            if s_lord in placed:
+                _add_weights(wmap, (placed[s_lord],), 3.0)
+            _add_weights(wmap, owned.get(s_lord, ()), 3.0)
 
         # planet itself (2×)
-        add([p_house], 2.0)
-        add(own_owned, 2.0)
+        _add_weights(wmap, (placed[p],), 2.0)
+        _add_weights(wmap, owned.get(p.lower(), ()), 2.0)
 
         # sign-lord package (1×)
         if sign_lord:
-            s2_lon = natal.planet_longitudes.get(sign_lord)
-            if s2_lon is not None:
-                add([str(house_num_of_lon(s2_lon, natal.house_cusps_deg))], 1.0)
-            add(planet_owned_houses(natal, sign_lord), 1.0)
+            if sign_lord in placed:
+                _add_weights(wmap, (placed[sign_lord],), 1.0)
+            _add_weights(wmap, owned.get(sign_lord, ()), 1.0)
 
-        weights[p] = wmap
+        weights[p.lower()] = wmap
 
+    natal._significators = weights
     return weights
 
-def promise_score_for_event(natal: "NatalContext", event: str) -> Dict[str, Any]:
+def promise_score_for_event(natal: "NatalContext", event: str,
+                            sig: Optional[Dict[str, Dict[str, float]]] = None) -> Dict[str, Any]:
     """
     KP-style promise check using house cuspal sub-lords (CSL) + significators.
     For each target house h in H+:
@@ -431,13 +504,15 @@ def promise_score_for_event(natal: "NatalContext", event: str) -> Dict[str, Any]
       - look at p's significator weights (planet_significators)
       - accumulate support: sum(weights on H+) - 0.8 * sum(weights on H-)
     Returns overall score, per-house breakdown, and a boolean promise flag.
+    `sig` may be passed in by callers that already hold planet_significators(natal).
     """
     from app.astrology.event_policies import EVENT_POLICIES
 
     pol = EVENT_POLICIES.get(event, EVENT_POLICIES["marriage"])
     Hpos, Hneg = pol["houses_pos"], pol["houses_neg"]
 
-    sig = planet_significators(natal)  # {planet: {house: weight}}
+    if sig is None:
+        sig = planet_significators(natal)  # {planet: {house: weight}}
     csl = compute_csl_for_houses(natal)  # { "1": "venus", ... }
 
     details = []
@@ -485,13 +560,7 @@ def current_transits(natal: NatalContext, as_of_dt: Optional[datetime] = None, o
         as_of_dt = datetime.now(timezone.utc)
     jd_ut = jd_from_datetime(as_of_dt)
 
-    cur: Dict[str, float] = {}
-    for name, const in PLANETS.items():
-        if name == "ketu":
-            rahu_lon = calc_lon(jd_ut, PLANETS["rahu"])
-            cur["ketu"] = normalize_deg(rahu_lon + 180.0)
-        else:
-            cur[name] = calc_lon(jd_ut, const)
+    cur = calc_lons(jd_ut)
 
     active: Dict[str, Any] = {}
     # Venus in 7th sign
@@ -504,13 +573,9 @@ def current_transits(natal: NatalContext, as_of_dt: Optional[datetime] = None, o
     tenth_lord = RULERS.get(tenth_sign)
     flag = False
     if tenth_lord and tenth_lord in natal.planet_longitudes:
-        j = cur["jupiter"]
-        lord_lon = natal.planet_longitudes[tenth_lord]
-        for ang in (0, 120, 240):
-            delta = abs(((j - lord_lon) - ang + 360.0) % 360.0)
-            if delta <= orb_deg or abs(delta - 360.0) <= orb_deg:
-                flag = True
-                break
+        # 0/120/240 are the multiples of 120°, so one distance mod 120 covers all three (orb < 60°)
+        delta = (cur["jupiter"] - natal.planet_longitudes[tenth_lord]) % 120.0
+        flag = min(delta, 120.0 - delta) <= orb_deg
     active["jupiter_aspecting_10th_lord"] = flag
 
     return TransitContext(active=active)
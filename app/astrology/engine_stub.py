@@ -1,6 +1,8 @@
 # app/astrology/engine_stub.py
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import accumulate
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timezone, timedelta
 import math, hashlib
@@ -9,10 +11,10 @@ ENGINE_VERSION = "stub-1.1"  # bumped
 
 # -------------------------- Constants --------------------------
 
-SIGNS = [
+SIGNS = (
     "Aries","Taurus","Gemini","Cancer","Leo","Virgo",
     "Libra","Scorpio","Sagittarius","Capricorn","Aquarius","Pisces"
-]
+)
 
 VIM_SEQUENCE = ["ketu","venus","sun","moon","mars","rahu","jupiter","saturn","mercury"]
 VIM_DURATIONS_YEARS = {
@@ -20,11 +22,20 @@ VIM_DURATIONS_YEARS = {
     "rahu": 18.0, "jupiter": 16.0, "saturn": 19.0, "mercury": 17.0
 }
 VIM_TOTAL = sum(VIM_DURATIONS_YEARS[p] for p in VIM_SEQUENCE)  # 120.0
+VIM_FRACS = tuple((p, VIM_DURATIONS_YEARS[p] / VIM_TOTAL) for p in VIM_SEQUENCE)  # (lord, share of cycle)
+VIM_INDEX = {p: i for i, p in enumerate(VIM_SEQUENCE)}
 YDAYS = 365.2425
+_TRANSIT_RATE = tuple(1 + i*0.1 for i in range(9))  # fake daily motion factor per planet, in planet_longitudes order
+
+RULERS = {
+    "Aries":"mars","Taurus":"venus","Gemini":"mercury","Cancer":"moon","Leo":"sun",
+    "Virgo":"mercury","Libra":"venus","Scorpio":"mars","Sagittarius":"jupiter",
+    "Capricorn":"saturn","Aquarius":"saturn","Pisces":"jupiter"
+}
 
 # -------------------------- Data classes --------------------------
 
-@dataclass
+@dataclass(slots=True)
 class NatalContext:
     utc_birth_dt: datetime
     latitude: float
@@ -34,15 +45,28 @@ class NatalContext:
     planet_longitudes: Dict[str, float]
     house_map: Dict[str, str]
 
-@dataclass
+@dataclass(slots=True)
 class DashaPeriod:
     planet: str
     start_jd: float
     end_jd: float
-    start_iso: str
-    end_iso: str
-
-@dataclass
+    # ISO strings are formatted on first access
+    _start_iso: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _end_iso: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def start_iso(self) -> str:
+        if self._start_iso is None:
+            self._start_iso = _iso_from_jd(self.start_jd)
+        return self._start_iso
+
+    @property
+    def end_iso(self) -> str:
+        if self._end_iso is None:
+            self._end_iso = _iso_from_jd(self.end_jd)
+        return self._end_iso
+
+@dataclass(slots=True)
 class DashaContext:
     maha: Optional[str]
     antara: Optional[str]
@@ -51,7 +75,7 @@ class DashaContext:
     window_to: str
     periods: List[DashaPeriod]
 
-@dataclass
+@dataclass(slots=True)
 class TransitContext:
     active: Dict[str, Any]
 
@@ -61,56 +85,68 @@ def _datetime_from_jd(jd: float) -> datetime:
     ts = (jd - 2440587.5) * 86400.0
     return datetime.fromtimestamp(ts, tz=timezone.utc)
 
+@lru_cache(maxsize=4096)
+def _iso_from_jd(jd: float) -> str:
+    # adjacent periods share boundary JDs, so each boundary is formatted once
+    return _datetime_from_jd(jd).isoformat()
+
 def _jd_from_datetime(dt: datetime) -> float:
     return dt.timestamp()/86400.0 + 2440587.5
 
 def _norm(x: float) -> float:
-    x = float(x) % 360.0
-    return x + 360.0 if x < 0 else x
+    # % with a positive modulus is already in [0, 360); no sign fix-up needed
+    return float(x) % 360.0
 
 def _sign(lon: float) -> str:
-    return SIGNS[int(math.floor(_norm(lon)/30.0))]
+    # lon % 360 is non-negative, so int() truncation then // 30 is the floor of lon/30
+    return SIGNS[int(lon % 360.0) // 30]
+
+# Stub planets and their base offsets; each takes one 4-byte slice of the seed digest
+_STUB_OFFSETS = (
+    ("sun", 0), ("moon", 30), ("mercury", 60), ("venus", 90),
+    ("mars", 120), ("jupiter", 150), ("saturn", 180), ("rahu", 210),
+)
 
-def _h(seed: str) -> float:
-    # stable 0..1 hash for deterministic stub longs
-    return (int(hashlib.sha256(seed.encode()).hexdigest(), 16) % 1_000_000) / 1_000_000.0
+def _h_all(seed: str):
+    # stable 0..1 fractions for deterministic stub longs: one SHA-256 covers all 8 planets
+    d = hashlib.sha256(seed.encode()).digest()
+    return [int.from_bytes(d[4*i:4*i + 4], "big") / 2**32 for i in range(len(_STUB_OFFSETS))]
 
 # -------------------------- Core stubs --------------------------
 
 def compute_natal(birth) -> NatalContext:
     """
     Deterministic placeholder (no ephemeris). Keeps interface stable.
+    Memoized per (utc_iso, lat, lon); the returned context is shared, treat it as read-only.
     """
     if not getattr(birth, "utc_iso", None):
         raise ValueError("birth.utc_iso required")
     if not hasattr(birth, "latitude") or not hasattr(birth, "longitude"):
         raise ValueError("latitude/longitude required")
 
-    dt_utc = datetime.fromisoformat(birth.utc_iso).astimezone(timezone.utc)
-    seed = f"{dt_utc.isoformat()}|{float(birth.latitude):.4f}|{float(birth.longitude):.4f}"
-
-    longs = {
-        "sun":     _norm(  0 + 360*_h("sun|"+seed)),
-        "moon":    _norm( 30 + 360*_h("moon|"+seed)),
-        "mercury": _norm( 60 + 360*_h("mercury|"+seed)),
-        "venus":   _norm( 90 + 360*_h("venus|"+seed)),
-        "mars":    _norm(120 + 360*_h("mars|"+seed)),
-        "jupiter": _norm(150 + 360*_h("jupiter|"+seed)),
-        "saturn":  _norm(180 + 360*_h("saturn|"+seed)),
-        "rahu":    _norm(210 + 360*_h("rahu|"+seed)),
-    }
+    return _compute_natal_cached(birth.utc_iso, float(birth.latitude), float(birth.longitude))
+
+@lru_cache(maxsize=1024)
+def _compute_natal_cached(utc_iso: str, latitude: float, longitude: float) -> NatalContext:
+    dt_utc = datetime.fromisoformat(utc_iso)
+    if dt_utc.tzinfo is not timezone.utc:  # "+00:00"/"Z" already parse to timezone.utc
+        dt_utc = dt_utc.astimezone(timezone.utc)
+    seed = f"{dt_utc.isoformat()}|{latitude:.4f}|{longitude:.4f}"
+
+    longs = {name: _norm(base + 360*frac) for (name, base), frac in zip(_STUB_OFFSETS, _h_all(seed))}
     longs["ketu"] = _norm(longs["rahu"] + 180.0)
 
     # fake houses/asc
-    ascendant_deg = _norm((float(birth.longitude)*4.0 + (dt_utc.hour*15.0)))
-    houses = [_norm(ascendant_deg + i*30.0) for i in range(12)]
-    house_map = {str(i+1): _sign(houses[i]) for i in range(12)}
+    ascendant_deg = _norm((longitude*4.0 + (dt_utc.hour*15.0)))
+    # houses are exactly 30° apart, so their signs just rotate SIGNS from the ascendant's sign
+    start_idx = int(ascendant_deg) // 30
+    house_map = {str(i+1): SIGNS[(start_idx + i) % 12] for i in range(12)}
     moon_sign = _sign(longs["moon"])
 
     return NatalContext(
         utc_birth_dt=dt_utc,
-        latitude=float(birth.latitude),
-        longitude=float(birth.longitude),
+        latitude=latitude,
+        longitude=longitude,
         ascendant_deg=ascendant_deg,
         moon_sign=moon_sign,
         planet_longitudes=longs,
@@ -144,27 +180,22 @@ def compute_vimshottari_dasha_for_birth(jd_ut: float) -> DashaContext:
         planet=lord.title(),
         start_jd=start,
         end_jd=end,
-        start_iso=_datetime_from_jd(start).isoformat(),
-        end_iso=_datetime_from_jd(end).isoformat(),
     ))
 
-    # Then: roll the rest with full durations
-    seq_idx = (VIM_SEQUENCE.index(lord) + 1) % len(VIM_SEQUENCE)
-    cur = end
+    # Then: roll the rest with full durations; boundaries are a running sum from the first end.
+    # Ten lords always reach max_jd (nine cover the cycle unless the first slice is under a day).
+    seq_idx = VIM_INDEX[lord] + 1
     max_jd = start + 120.0 * YDAYS + 1.0  # full Vim cycle
-    while cur < max_jd:
-        p = VIM_SEQUENCE[seq_idx % len(VIM_SEQUENCE)]
-        span = VIM_DURATIONS_YEARS[p] * YDAYS
-        nxt = cur + span
+    lords = [VIM_SEQUENCE[(seq_idx + k) % len(VIM_SEQUENCE)] for k in range(10)]
+    bounds = list(accumulate((VIM_DURATIONS_YEARS[p] * YDAYS for p in lords), initial=end))
+    for p, cur, nxt in zip(lords, bounds, bounds[1:]):
+        if cur >= max_jd:
+            break
         periods.append(DashaPeriod(
             planet=p.title(),
             start_jd=cur,
             end_jd=nxt,
-            start_iso=_datetime_from_jd(cur).isoformat(),
-            end_iso=_datetime_from_jd(nxt).isoformat(),
         ))
-        cur = nxt
-        seq_idx += 1
 
     maha = periods[0].planet if periods else None
     antara = periods[1].planet if len(periods) > 1 else None
@@ -181,6 +212,36 @@ def compute_vimshottari_dasha_for_birth(jd_ut: float) -> DashaContext:
 
 # -------------------------- Subdivision (antara/pratyantara) --------------------------
 
+class _PeriodRow(dict):
+    """Subdivision row; 'start_iso'/'end_iso' are formatted from the JDs on first lookup."""
+    __slots__ = ()
+    _ISO_KEYS = {"start_iso": "start_jd", "end_iso": "end_jd"}
+
+    def __missing__(self, key):
+        jd_key = self._ISO_KEYS.get(key)
+        if jd_key is None:
+            raise KeyError(key)
+        iso = self[key] = _iso_from_jd(self[jd_key])
+        return iso
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+def _split_period(start_jd: float, end_jd: float):
+    """(lord, start, end) children of a period in VIM_FRACS order; boundaries are one running sum."""
+    length = end_jd - start_jd
+    bounds = list(accumulate((length * frac for _, frac in VIM_FRACS), initial=start_jd))
+    out = []
+    for k, (lord, _) in enumerate(VIM_FRACS):
+        c_end = min(bounds[k + 1], end_jd)
+        out.append((lord, bounds[k], c_end))
+        if c_end >= end_jd - 1e-6:
+            break
+    return out
+
 def subdivide_vimshottari(dasha_ctx, levels: int = 2):
     """
     Return list of dicts for subperiods:
@@ -191,15 +252,13 @@ def subdivide_vimshottari(dasha_ctx, levels: int = 2):
     out: List[Dict[str, Any]] = []
 
     def add_block(level, lord, start_jd, end_jd, parent=None):
-        out.append({
-            "level": level,
-            "lord": lord,
-            "parent": parent,
-            "start_jd": float(start_jd),
-            "end_jd": float(end_jd),
-            "start_iso": _datetime_from_jd(start_jd).isoformat(),
-            "end_iso": _datetime_from_jd(end_jd).isoformat(),
-        })
+        out.append(_PeriodRow(
+            level=level,
+            lord=lord,
+            parent=parent,
+            start_jd=float(start_jd),
+            end_jd=float(end_jd),
+        ))  # start_iso / end_iso filled in lazily
 
     for maha in getattr(dasha_ctx, "periods", []):
         m_lord = (maha.planet or "").lower()
@@ -209,32 +268,18 @@ def subdivide_vimshottari(dasha_ctx, levels: int = 2):
             continue
 
         # Antara: split Maha proportionally (lord years / 120)
-        m_len = m_end - m_start
-        cursor = m_start
-        for lord in VIM_SEQUENCE:
-            frac = VIM_DURATIONS_YEARS[lord] / VIM_TOTAL
-            span = m_len * frac
-            a_start, a_end = cursor, min(cursor + span, m_end)
+        first = len(out)
+        for lord, a_start, a_end in _split_period(m_start, m_end):
             add_block("antara", lord, a_start, a_end, parent=m_lord)
-            cursor = a_end
-            if cursor >= m_end - 1e-6:
-                break
+        antaras_here = out[first:]
 
         if levels < 3:
             continue
 
-        # Pratyantara: split each antara proportionally
-        for a in [x for x in out if x["level"] == "antara" and x["parent"] == m_lord and m_start - 1e-6 <= x["start_jd"] <= m_end + 1e-6]:
-            a_len = a["end_jd"] - a["start_jd"]
-            cursor = a["start_jd"]
-            for lord2 in VIM_SEQUENCE:
-                frac2 = VIM_DURATIONS_YEARS[lord2] / VIM_TOTAL
-                span2 = a_len * frac2
-                p_start, p_end = cursor, min(cursor + span2, a["end_jd"])
+        # Pratyantara: split each antara of this maha proportionally
+        for a in antaras_here:
+            for lord2, p_start, p_end in _split_period(a["start_jd"], a["end_jd"]):
                 add_block("pratyantara", lord2, p_start, p_end, parent=a["lord"])
-                cursor = p_end
-                if cursor >= a["end_jd"] - 1e-6:
-                    break
 
     return out
 
@@ -244,27 +289,19 @@ def current_transits(natal: NatalContext, as_of: Optional[datetime]=None, orb: f
     as_of = as_of or datetime.now(timezone.utc)
     day_shift = ((as_of - natal.utc_birth_dt).total_seconds()/86400.0) % 360.0
 
-    cur = {k: _norm(v + day_shift*(1 + i*0.1)) for i,(k,v) in enumerate(natal.planet_longitudes.items())}
+    cur = {k: (v + day_shift*r) % 360.0 for (k,v), r in zip(natal.planet_longitudes.items(), _TRANSIT_RATE)}
 
     active: Dict[str, Any] = {}
     # Example triggers matching your rulebook keys
     active["venus_transit_7th"] = (_sign(cur["venus"]) == natal.house_map.get("7"))
     active["saturn_in_10th"]    = (_sign(cur["saturn"]) == natal.house_map.get("10"))
 
-    rulers = {
-        "Aries":"mars","Taurus":"venus","Gemini":"mercury","Cancer":"moon","Leo":"sun",
-        "Virgo":"mercury","Libra":"venus","Scorpio":"mars","Sagittarius":"jupiter",
-        "Capricorn":"saturn","Aquarius":"saturn","Pisces":"jupiter"
-    }
-    tenth_lord = rulers.get(natal.house_map.get("10",""), "")
+    tenth_lord = RULERS.get(natal.house_map.get("10",""), "")
     flag = False
     if tenth_lord and tenth_lord in natal.planet_longitudes:
-        j = cur["jupiter"]; lord = natal.planet_longitudes[tenth_lord]
-        for ang in (0,120,240):
-            d = abs(((j - lord) - ang + 360.0) % 360.0)
-            if d <= orb or abs(d-360.0) <= orb:
-                flag = True
-                break
+        # 0/120/240 are the multiples of 120°, so one distance mod 120 covers all three (orb < 60°)
+        d = (cur["jupiter"] - natal.planet_longitudes[tenth_lord]) % 120.0
+        flag = min(d, 120.0 - d) <= orb
     active["jupiter_aspecting_10th_lord"] = flag
 
     return TransitContext(active=active)
@@ -1,9 +1,10 @@
+import os, pickle, hashlib
 import pandas as pd
 from dataclasses import dataclass
 from typing import List, Optional
 from pathlib import Path
 
-@dataclass
+@dataclass(slots=True)
 class Rule:
     id: str
     theme: str
@@ -14,22 +15,47 @@ class Rule:
     date_to: Optional[str] = None
     logic: Optional[str] = None
 
+# Cache format key: a hash of this module, so any change to Rule or the parser invalidates old pickles
+_CACHE_KEY = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+
 class RuleLibrary:
-    def __init__(self, rules: List[Rule]): self.rules = rules
+    def __init__(self, rules: List[Rule]):
+        self.rules = rules
+        # trigger -> positions in self.rules, so matching only visits rules of active triggers
+        self.by_trigger = {}
+        for i, r in enumerate(rules): self.by_trigger.setdefault(r.trigger, []).append(i)
+
+    def fired(self, active) -> List[Rule]:
+        """Rules whose trigger is truthy in `active`, in rulebook order."""
+        idx = sorted(i for t, on in active.items() if on for i in self.by_trigger.get(t, ()))
+        return [self.rules[i] for i in idx]
 
     @staticmethod
     def load_from_file(path: str):
         p = Path(path); 
+        # Parsed rules are cached in a sibling .pkl as (_CACHE_KEY, rules), reused while it is
+        # newer than the source file and was written by this version of the module
+        cache = p.with_suffix(".pkl")
+        try:
+            if cache.stat().st_mtime >= p.stat().st_mtime:
+                with open(cache, "rb") as f: key, rules = pickle.load(f)
+                if key == _CACHE_KEY: return RuleLibrary(rules)
+        except Exception: pass  # missing, unreadable or old-format cache: parse the source
         if p.suffix.lower() in [".xls",".xlsx"]: df = pd.read_excel(p)
         else: df = pd.read_csv(p)
         req = ["ID","Theme","Astrological Trigger","Natural Prediction Message","Tone Options"]
         for c in req:
             if c not in df.columns: raise ValueError(f"Missing column: {c}")
-        rules = []
-        for _,row in df.iterrows():
-            rules.append(Rule(id=str(row["ID"]), theme=str(row["Theme"]), trigger=str(row["Astrological Trigger"]).strip(),
-                              message=str(row["Natural Prediction Message"]).strip(), tone=str(row.get("Tone Options","Friendly")),
-                              logic=str(row.get("Logic","")) if "Logic" in df.columns else None))
+        # Walk plain column lists; iterrows would box every row into a Series
+        ids, themes, triggers, messages, tones = (df[c].tolist() for c in req)
+        logics = [str(x) for x in df["Logic"].tolist()] if "Logic" in df.columns else [None] * len(df)
+        rules = [Rule(id=str(i), theme=str(th), trigger=str(tr).strip(), message=str(m).strip(), tone=str(tn), logic=lg)
+                 for i, th, tr, m, tn, lg in zip(ids, themes, triggers, messages, tones, logics)]
+        try:
+            tmp = cache.with_name(f"{cache.name}.{os.getpid()}.tmp")
+            with open(tmp, "wb") as f: pickle.dump((_CACHE_KEY, rules), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, cache)
+        except OSError: pass  # read-only deploy: just skip the cache
         return RuleLibrary(rules)
 
     @staticmethod
@@ -11,6 +11,7 @@ try:
         jd_from_datetime,
         compute_csl_for_houses,     # NEW
         planet_significators,       # NEW
+        promise_score_for_event,
     )
 except Exception:
     from app.astrology.engine_stub import (
@@ -29,25 +30,31 @@ except Exception:
 
 
 from fastapi import FastAPI, Request, HTTPException, status, Form
-from fastapi.responses import HTMLResponse, JSONResponse, PlainTextResponse
+from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.templating import Jinja2Templates
-from pydantic import BaseModel
-from typing import Optional, List, Dict, Any
+from pydantic import BaseModel, ConfigDict
+from typing import Optional, List, Dict, Any, NamedTuple
 from datetime import datetime, timezone, timedelta
 from zoneinfo import ZoneInfo
 import calendar
 import importlib, traceback, os
+import orjson
 
 # ---- Rules / phrasing / analytics ----
 from app.astrology.rules import RuleLibrary
-from app.services.phrasing import phrase_prediction
+from app.services.phrasing import phrase_predictions
 from app.analytics.tracker import record_event_with_ga, query_summary
 
 ADMIN_PASSWORD = os.getenv("ADMIN_PASSWORD", "changeme")
 
-app = FastAPI(title="Vedic Astrology — Production Demo")
+class OrjsonResponse(JSONResponse):
+    # orjson's C encoder for all JSON responses (fastapi's own ORJSONResponse is deprecated upstream)
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+app = FastAPI(title="Vedic Astrology — Production Demo", default_response_class=OrjsonResponse)
 app.add_middleware(CORSMiddleware, allow_origins=["*"], allow_methods=["*"], allow_headers=["*"])
 
 app.mount("/static", StaticFiles(directory="app/static"), name="static")
@@ -60,7 +67,14 @@ rule_lib = RuleLibrary.load_default()
 # Models
 # =========================
 
+class BirthRec(NamedTuple):
+    # Minimal birth record for compute_natal (debug routes / dict bodies)
+    utc_iso: Optional[str]
+    latitude: Optional[float]
+    longitude: Optional[float]
+
 class BirthPayload(BaseModel):
+    model_config = ConfigDict(frozen=True)  # routes read payloads only; normalized UTC lives in a local
     name: Optional[str] = None
     dob: str
     # Provide either utc_iso OR (local_iso + tz)
@@ -73,6 +87,7 @@ class BirthPayload(BaseModel):
 
 # in EventPayload (replace your existing class)
 class EventPayload(BaseModel):
+    model_config = ConfigDict(frozen=True)
     name: Optional[str] = None
     dob: str
     utc_iso: Optional[str] = None
@@ -97,48 +112,80 @@ class EventPayload(BaseModel):
 
 from app.astrology.event_policies import EVENT_POLICIES
 from datetime import datetime, timezone
+from collections import defaultdict
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from dataclasses import replace
 import calendar
 
-def _age_on(dt_birth: datetime, iso_str: str) -> float:
-    return (datetime.fromisoformat(iso_str.replace("Z","+00:00")) - dt_birth).days / 365.2425
+def _age_at_jd(birth_jd: float, jd: float) -> float:
+    # whole days, like the timedelta.days this replaced; unclamped so pre-birth starts stay negative
+    return ((jd - birth_jd) // 1.0) / 365.2425
+
+def _ym(iso: str):
+    """(year, month) of an ISO timestamp, parsed once."""
+    dt = datetime.fromisoformat(iso.replace("Z","+00:00"))
+    return dt.year, dt.month
 
 def _score_planet_for_event(sig_map, lord, Hpos, Hneg, focus):
-    m = sig_map.get(lord.lower(), {})
+    # lord comes from subdivide_vimshottari, which already emits lowercase names
+    m = sig_map.get(lord, {})
     s = sum(m.get(h,0.0) for h in Hpos) - 0.8 * sum(m.get(h,0.0) for h in Hneg)
-    return s + 0.5*focus.get(lord.lower(), 0.0)
+    return s + 0.5*focus.get(lord, 0.0)
 
-def select_dba_windows(natal, dasha_ctx, question: str, direction="nearest", anchor_iso=None):
+def select_dba_windows(natal, dasha_ctx, question: str, direction="nearest", anchor_iso=None, sig=None):
     pol = EVENT_POLICIES.get(question, EVENT_POLICIES["marriage"])
     Hpos, Hneg = pol["houses_pos"], pol["houses_neg"]
     focus = pol.get("focus_planets", {})
     age_min, age_max = pol["age_min"], pol["age_max"]
 
-    sig = planet_significators(natal)
+    if sig is None:  # callers that already hold planet_significators(natal) pass it in
+        sig = planet_significators(natal)
+    birth_jd = jd_from_datetime(natal.utc_birth_dt)
     subs = subdivide_vimshottari(dasha_ctx, levels=3)
-    # Make (M,A,P) triplets inside each maha
+    # Make (M,A,P) triplets inside each maha: bucket rows by (level, parent) once, in start order,
+    # then bisect each parent's [start, end) window instead of rescanning all subs
+    by_parent = defaultdict(list)
+    for s in subs:
+        by_parent[(s["level"], s["parent"])].append(s)
+    starts = {}
+    for key, bucket in by_parent.items():
+        bucket.sort(key=lambda x: x["start_jd"])
+        starts[key] = [x["start_jd"] for x in bucket]
+
+    def children(level, parent):
+        key = (level, parent["lord"])
+        st = starts.get(key)
+        if not st:
+            return []
+        return by_parent[key][bisect_left(st, parent["start_jd"]):bisect_left(st, parent["end_jd"])]
+
     triplets = []
     for m in [s for s in subs if s["level"]=="maha"]:
-        A = [a for a in subs if a["level"]=="antara" and a["parent"]==m["lord"] and m["start_jd"] <= a["start_jd"] < m["end_jd"]]
+        A = children("antara", m)
         for a in A:
-            P = [p for p in subs if p["level"]=="pratyantara" and p["parent"]==a["lord"] and a["start_jd"] <= p["start_jd"] < a["end_jd"]]
+            P = children("pratyantara", a)
             if not P:
                 triplets.append((m,a,None))
             else:
                 for p in P:
                     triplets.append((m,a,p))
 
+    # A lord's score depends only on the lord, so score each of the (at most nine) lords once
+    lord_score = {l: _score_planet_for_event(sig, l, Hpos, Hneg, focus) for l in {s["lord"] for s in subs}}
+
     # Score & filter by age window
     rows = []
     for (M,A,P) in triplets:
         win = P or A or M
-        age_start = _age_on(natal.utc_birth_dt, win["start_iso"])
-        age_end   = _age_on(natal.utc_birth_dt, win["end_iso"])
+        age_start = _age_at_jd(birth_jd, win["start_jd"])
+        age_end   = _age_at_jd(birth_jd, win["end_jd"])
         if (age_end < age_min) or (age_start > age_max):
             continue  # implausible
 
-        sM = _score_planet_for_event(sig, M["lord"], Hpos, Hneg, focus)
-        sA = _score_planet_for_event(sig, A["lord"], Hpos, Hneg, focus) if A else 0.0
-        sP = _score_planet_for_event(sig, P["lord"], Hpos, Hneg, focus) if P else 0.0
+        sM = lord_score[M["lord"]]
+        sA = lord_score[A["lord"]] if A else 0.0
+        sP = lord_score[P["lord"]] if P else 0.0
         score = 0.3*sM + 0.6*sA + 1.0*sP + (0.2 if P else 0.0)
 
         rows.append({
@@ -161,6 +208,11 @@ def select_dba_windows(natal, dasha_ctx, question: str, direction="nearest", anc
     return rows[:12]  # top 12 candidates
 
 
+@lru_cache(maxsize=512)
+def _zi(tzname: str) -> ZoneInfo:
+    # ZoneInfo only keeps a handful of zones strongly cached; hold on to the ones we've seen
+    return ZoneInfo(tzname)
+
 def normalize_utc_iso(payload) -> str:
     """
     Return a UTC ISO string using either:
@@ -173,16 +225,56 @@ def normalize_utc_iso(payload) -> str:
     if getattr(payload, "local_iso", None):
         tzname = getattr(payload, "tz", None) or "UTC"
         dt_local = datetime.fromisoformat(payload.local_iso)
+        # Already UTC: hand the (validated) string back as-is, like utc_iso, instead of re-formatting it
+        if dt_local.tzinfo is timezone.utc:
+            if payload.local_iso.endswith("+00:00"):
+                return payload.local_iso
+            if payload.local_iso.endswith("Z"):
+                return payload.local_iso[:-1] + "+00:00"
         # If the local string had no tzinfo, apply tz; else respect provided offset
         if dt_local.tzinfo is None:
             try:
-                dt_local = dt_local.replace(tzinfo=ZoneInfo(tzname))
+                dt_local = dt_local.replace(tzinfo=_zi(tzname))
             except Exception:
                 raise HTTPException(status_code=400, detail=f"Unknown timezone: {tzname}")
         return dt_local.astimezone(timezone.utc).isoformat()
 
     raise HTTPException(status_code=400, detail="Provide either utc_iso or (local_iso + tz)")
 
+# Natal + dasha per birth, shared by the API and debug routes; the results are read-only
+@lru_cache(maxsize=1024)
+def _birth_chart(utc_iso: str, lat: float, lon: float):
+    natal = compute_natal(BirthRec(utc_iso, lat, lon))
+    birth_jd = jd_from_datetime(natal.utc_birth_dt)
+    return natal, birth_jd, compute_vimshottari_dasha_for_birth(birth_jd)
+
+def _birth_subs(utc_iso: str, lat: float, lon: float, levels: int = 3):
+    # lru_cache keys a defaulted, positional or keyword `levels` differently; always pass it positionally
+    return _birth_subs_cached(utc_iso, lat, lon, int(levels))
+
+# A levels=3 subdivision is ~800 rows, so keep fewer of these than charts
+@lru_cache(maxsize=64)
+def _birth_subs_cached(utc_iso: str, lat: float, lon: float, levels: int):
+    return subdivide_vimshottari(_birth_chart(utc_iso, lat, lon)[2], levels=levels)
+
+# level -> (start_jds, rows) in start order over the cached subdivision; periods of a level tile the timeline
+@lru_cache(maxsize=64)
+def _birth_level_index(utc_iso: str, lat: float, lon: float):
+    by_level = defaultdict(list)
+    for s in _birth_subs(utc_iso, lat, lon):
+        by_level[s["level"]].append(s)
+    index = {}
+    for level, rows in by_level.items():
+        rows.sort(key=lambda x: x["start_jd"])
+        index[level] = ([x["start_jd"] for x in rows], rows)
+    return index
+
+def _active_row(index, level: str, jd: float):
+    """Row of `level` whose [start_jd, end_jd) contains jd, or None."""
+    starts, rows = index.get(level, ((), ()))
+    i = bisect_right(starts, jd) - 1
+    return rows[i] if i >= 0 and jd < rows[i]["end_jd"] else None
+
 # KP-flavoured preferences
 QUESTION_FOCUS = {
     "marriage":  ["venus","jupiter","moon"],
@@ -199,9 +291,6 @@ AGE_MIN = {
     "travel":   12.0,
 }
 
-def age_years_at_jd(birth_jd: float, jd: float) -> float:
-    return max(0.0, (jd - birth_jd) / 365.2425)
-
 # House rulers (sidereal) by sign
 RULERS = {
     "Aries":"mars","Taurus":"venus","Gemini":"mercury","Cancer":"moon","Leo":"sun",
@@ -245,27 +334,28 @@ def soft_aspect_score(a_deg: float, b_deg: float, orb: float = 6.0) -> float:
             best = max(best, 1.0 - d/orb)
     return best
 
-def score_subperiod(natal, sub, question: str) -> float:
+# Supporting / opposing houses per question for score_subperiod
+SUBPERIOD_TARGETS = {
+    "marriage":  (("7","2","11"), ("1","6","10")),
+    "child":     (("5","2","11","9"), ("1","4","10")),
+    "promotion": (("10","11","2","6"), ("12","8")),   # include 6 for service
+    "travel":    (("12","9","3"), ("4","2")),         # residence vs travel tensions
+}
+
+def score_subperiod(sig, sub, question: str) -> float:
     """
-    KP-flavoured DBA scoring:
+    KP-flavoured DBA scoring (sig = planet_significators(natal), computed once by the caller):
       - Use planet significators (star-lord, own, sign-lord weights).
       - For the subperiod's lord (and optionally its parent/maha) aggregate support
         for the target houses, subtract opposing houses.
       - Still keep a tiny preference for deeper periods.
     """
-    TARGETS = {
-        "marriage":  (["7","2","11"], ["1","6","10"]),
-        "child":     (["5","2","11","9"], ["1","4","10"]),
-        "promotion": (["10","11","2","6"], ["12","8"]),   # include 6 for service
-        "travel":    (["12","9","3"], ["4","2"]),         # residence vs travel tensions
-    }
-    pos, neg = TARGETS.get((question or "").lower(), (["7","2","11"], ["1","6","10"]))
-
-    sig = planet_significators(natal)
+    pos, neg = SUBPERIOD_TARGETS.get((question or "").lower(), SUBPERIOD_TARGETS["marriage"])
 
     # Consider the sub-lord; add small contributions from its parent and maha if present
-    l_sub = sub["lord"].lower()
-    l_par = (sub.get("parent") or "").lower()
+    # (subdivide_vimshottari already lowercases lords, so no per-call .lower() here)
+    l_sub = sub["lord"]
+    l_par = sub.get("parent")
     # try to find maha parent if present in our list (we can pass it in via subdivider, but here we keep it simple)
 
     def planet_score(pl: str, k: float) -> float:
@@ -314,6 +404,27 @@ def debug_engine_import():
     except Exception:
         return {"ok": False, "error": traceback.format_exc()}
 
+# Nakshatra / Vimshottari tables shared by the debug routes
+_NAK_SPAN = 360.0 / 27.0
+_NAKSHATRAS = (
+    "Ashwini","Bharani","Krittika","Rohini","Mrigashira","Ardra","Punarvasu",
+    "Pushya","Ashlesha","Magha","Purva Phalguni","Uttara Phalguni","Hasta",
+    "Chitra","Swati","Vishakha","Anuradha","Jyeshtha","Mula","Purva Ashadha",
+    "Uttara Ashadha","Shravana","Dhanishta","Shatabhisha","Purva Bhadrapada",
+    "Uttara Bhadrapada","Revati"
+)
+_LORD_SEQ = ("ketu","venus","sun","moon","mars","rahu","jupiter","saturn","mercury")
+_VIMS_YEARS = (7, 20, 6, 10, 7, 18, 16, 19, 17)  # parallel to _LORD_SEQ
+# nakshatra -> (name, dasha lord, lord's years): one lookup instead of three tables
+_NAK_TABLE = tuple((name, _LORD_SEQ[i % 9], _VIMS_YEARS[i % 9]) for i, name in enumerate(_NAKSHATRAS))
+
+def _moon_nakshatra_summary(moon_lon: float):
+    """(nakshatra index, name, fraction elapsed, maha lord, years left in that maha) for the Moon."""
+    idx = int(moon_lon // _NAK_SPAN)
+    frac = (moon_lon - idx * _NAK_SPAN) / _NAK_SPAN
+    name, lord, years = _NAK_TABLE[idx % 27]
+    return idx, name, frac, lord, years * (1.0 - frac)
+
 @app.get("/debug/nakshatra")
 def debug_nakshatra(utc_iso: str, lat: float = 0.0, lon: float = 0.0):
     """
@@ -321,26 +432,10 @@ def debug_nakshatra(utc_iso: str, lat: float = 0.0, lon: float = 0.0):
       /debug/nakshatra?utc_iso=1990-04-20T05:25:00+00:00&lat=16.7&lon=74.25
     """
     try:
-        birth = type("B", (), {"utc_iso": utc_iso, "latitude": lat, "longitude": lon})()
-        natal = compute_natal(birth)
-        jd = jd_from_datetime(natal.utc_birth_dt)
+        natal, jd, _ = _birth_chart(utc_iso, lat, lon)
 
         moon_lon = natal.planet_longitudes["moon"]
-        span = 360.0 / 27.0
-        idx = int(moon_lon // span)
-        frac = (moon_lon - idx * span) / span
-        nakshatras = [
-            "Ashwini","Bharani","Krittika","Rohini","Mrigashira","Ardra","Punarvasu",
-            "Pushya","Ashlesha","Magha","Purva Phalguni","Uttara Phalguni","Hasta",
-            "Chitra","Swati","Vishakha","Anuradha","Jyeshtha","Mula","Purva Ashadha",
-            "Uttara Ashadha","Shravana","Dhanishta","Shatabhisha","Purva Bhadrapada",
-            "Uttara Bhadrapada","Revati"
-        ]
-        nname = nakshatras[idx % 27]
-        lord_seq = ["ketu","venus","sun","moon","mars","rahu","jupiter","saturn","mercury"]
-        vims_years = {"ketu":7,"venus":20,"sun":6,"moon":10,"mars":7,"rahu":18,"jupiter":16,"saturn":19,"mercury":17}
-        maha_lord = lord_seq[idx % 9]
-        balance_years = vims_years[maha_lord] * (1.0 - frac)
+        idx, nname, frac, maha_lord, balance_years = _moon_nakshatra_summary(moon_lon)
 
         return {
             "moon_longitude": round(moon_lon, 4),
@@ -357,58 +452,39 @@ def debug_nakshatra(utc_iso: str, lat: float = 0.0, lon: float = 0.0):
 
 @app.get("/debug/dasha")
 def debug_dasha(utc_iso: str, lat: float, lon: float, levels: int = 2, limit: int = 12):
-    birth = type("B", (), {"utc_iso": utc_iso, "latitude": lat, "longitude": lon})()
-    natal = compute_natal(birth)
-    jd = jd_from_datetime(natal.utc_birth_dt)
-    dasha = compute_vimshottari_dasha_for_birth(jd)
-    subs = subdivide_vimshottari(dasha, levels=levels)
+    subs = _birth_subs(utc_iso, lat, lon, levels)
     rows = [
         {"level": s["level"], "lord": s["lord"], "start": s["start_iso"], "end": s["end_iso"]}
         for s in subs[:max(1, limit)]
     ]
     return {"engine": ENGINE_VERSION, "rows": rows}
 
+CSV_CHUNK_ROWS = 256
+
 @app.get("/debug/calc")
 def debug_calc(utc_iso: str, lat: float, lon: float, levels: int = 3, limit: int = 60, csv: bool = False):
     """
     /debug/calc?utc_iso=1990-04-20T05:25:00+00:00&lat=16.7&lon=74.25&levels=3&limit=30
     """
     try:
-        birth = type("B", (), {"utc_iso": utc_iso, "latitude": lat, "longitude": lon})()
-        natal = compute_natal(birth)
-        jd = jd_from_datetime(natal.utc_birth_dt)
-        dasha = compute_vimshottari_dasha_for_birth(jd)
-        subs = subdivide_vimshottari(dasha, levels=levels)
+        natal, jd, dasha = _birth_chart(utc_iso, lat, lon)
+        subs = _birth_subs(utc_iso, lat, lon, levels)
 
         moon_lon = natal.planet_longitudes["moon"]
-        span = 360.0 / 27.0
-        nidx = int(moon_lon // span)
-        nfrac = (moon_lon - nidx * span) / span
-        nakshatras = [
-            "Ashwini","Bharani","Krittika","Rohini","Mrigashira","Ardra","Punarvasu",
-            "Pushya","Ashlesha","Magha","Purva Phalguni","Uttara Phalguni","Hasta",
-            "Chitra","Swati","Vishakha","Anuradha","Jyeshtha","Mula","Purva Ashadha",
-            "Uttara Ashadha","Shravana","Dhanishta","Shatabhisha","Purva Bhadrapada",
-            "Uttara Bhadrapada","Revati"
-        ]
-        nname = nakshatras[nidx % 27]
-        lord_seq = ["ketu","venus","sun","moon","mars","rahu","jupiter","saturn","mercury"]
-        vims_years = {"ketu":7,"venus":20,"sun":6,"moon":10,"mars":7,"rahu":18,"jupiter":16,"saturn":19,"mercury":17}
-        maha_lord = lord_seq[nidx % 9]
-        balance_years = vims_years[maha_lord] * (1.0 - nfrac)
+        nidx, nname, nfrac, maha_lord, balance_years = _moon_nakshatra_summary(moon_lon)
 
         rows = [{"level": s["level"], "lord": s["lord"], "start": s["start_iso"], "end": s["end_iso"]}
                 for s in subs[:max(1, limit)]]
 
         if csv:
-            out = []
-            out.append("moon_longitude,nakshatra_index,nakshatra_name,nakshatra_fraction,maha_dasha_lord,remaining_years")
-            out.append(f'{round(moon_lon,4)},{nidx},{nname},{round(nfrac,4)},{maha_lord},{round(balance_years,2)}')
-            out.append("")
-            out.append("level,lord,start,end")
-            for r in rows:
-                out.append(f'{r["level"]},{r["lord"]},{r["start"]},{r["end"]}')
-            return PlainTextResponse("\n".join(out))
+            def csv_chunks():
+                yield ("moon_longitude,nakshatra_index,nakshatra_name,nakshatra_fraction,maha_dasha_lord,remaining_years\n"
+                       f'{round(moon_lon,4)},{nidx},{nname},{round(nfrac,4)},{maha_lord},{round(balance_years,2)}\n'
+                       "\nlevel,lord,start,end")
+                # Rows go out in batches: each chunk of a sync iterator costs a threadpool hop
+                for i in range(0, len(rows), CSV_CHUNK_ROWS):
+                    yield "".join(f'\n{r["level"]},{r["lord"]},{r["start"]},{r["end"]}' for r in rows[i:i + CSV_CHUNK_ROWS])
+            return StreamingResponse(csv_chunks(), media_type="text/plain")
         else:
             return {
                 "engine": ENGINE_VERSION,
@@ -421,12 +497,11 @@ def debug_calc(utc_iso: str, lat: float, lon: float, levels: int = 3, limit: int
                 "rows": rows
             }
     except Exception as e:
-        return JSONResponse({"error": str(e)}, status_code=500)
+        return OrjsonResponse({"error": str(e)}, status_code=500)
 
 @app.get("/debug/csl")
 def debug_csl(utc_iso: str, lat: float, lon: float):
-    birth = type("B", (), {"utc_iso": utc_iso, "latitude": lat, "longitude": lon})()
-    natal = compute_natal(birth)
+    natal = _birth_chart(utc_iso, lat, lon)[0]
     csl = compute_csl_for_houses(natal)
     return {
         "engine": ENGINE_VERSION,
@@ -436,8 +511,7 @@ def debug_csl(utc_iso: str, lat: float, lon: float):
 
 @app.get("/debug/significators")
 def debug_significators(utc_iso: str, lat: float, lon: float):
-    birth = type("B", (), {"utc_iso": utc_iso, "latitude": lat, "longitude": lon})()
-    natal = compute_natal(birth)
+    natal = _birth_chart(utc_iso, lat, lon)[0]
     sig = planet_significators(natal)
     # Show top 5 houses per planet for readability
     view = {}
@@ -461,31 +535,20 @@ def debug_dba_active(
         if utc_iso.endswith("Z"): utc_iso = utc_iso.replace("Z","+00:00")
         if asof.endswith("Z"): asof = asof.replace("Z","+00:00")
 
-        birth = type("B", (), {"utc_iso": utc_iso, "latitude": lat, "longitude": lon})()
-        natal = compute_natal(birth)
-        jd_birth = jd_from_datetime(natal.utc_birth_dt)
-        dasha = compute_vimshottari_dasha_for_birth(jd_birth)
+        index = _birth_level_index(utc_iso, lat, lon)
 
         # date to check
         asof_dt = datetime.fromisoformat(asof)
         asof_jd = jd_from_datetime(asof_dt)
 
         # find maha containing asof
-        maha = None
-        for p in dasha.periods:
-            if p.start_jd <= asof_jd < p.end_jd:
-                maha = {"lord": p.planet.lower(), "start": p.start_iso, "end": p.end_iso, "start_jd": p.start_jd, "end_jd": p.end_jd}
-                break
-        if not maha:
+        m = _active_row(index, "maha", asof_jd)
+        if not m:
             return {"error": "as-of date outside computed dasha window"}
+        maha = {"lord": m["lord"], "start": m["start_iso"], "end": m["end_iso"], "start_jd": m["start_jd"], "end_jd": m["end_jd"]}
 
-        # subdivide only this maha (levels=3 with correct rotation)
-        sub_all = subdivide_vimshottari(
-            type("D", (), {"periods": [type("P", (), maha)()]})(), levels=3
-        )
-
-        antara = next((s for s in sub_all if s["level"]=="antara" and s["start_jd"] <= asof_jd < s["end_jd"]), None)
-        praty  = next((s for s in sub_all if s["level"]=="pratyantara" and s["start_jd"] <= asof_jd < s["end_jd"]), None)
+        antara = _active_row(index, "antara", asof_jd)
+        praty  = _active_row(index, "pratyantara", asof_jd)
 
         return {
             "engine": ENGINE_VERSION,
@@ -498,7 +561,7 @@ def debug_dba_active(
             "praty_window": {"from": praty["start_iso"], "to": praty["end_iso"]} if praty else None,
         }
     except Exception as e:
-        return JSONResponse({"error": str(e)}, status_code=500)
+        return OrjsonResponse({"error": str(e)}, status_code=500)
 
 
 
@@ -509,26 +572,18 @@ def debug_dba_active(
 @app.post("/api/v1/predict")
 def predict(b: BirthPayload, request: Request):
     # Normalize time to UTC inside the request
-    b.utc_iso = normalize_utc_iso(b)
+    utc_iso = normalize_utc_iso(b)
 
-    natal = compute_natal(b)
-    jd = jd_from_datetime(natal.utc_birth_dt)
-    dasha = compute_vimshottari_dasha_for_birth(jd)
+    natal, jd, dasha = _birth_chart(utc_iso, b.latitude, b.longitude)
     transits = current_transits(natal)
 
-    fired = []
-    for r in rule_lib.rules:
-        if transits.active.get(r.trigger, False):
-            r.date_from = dasha.window_from
-            r.date_to = dasha.window_to
-            fired.append(r)
+    # Per-request copies: the library's Rule objects are shared across concurrent requests
+    fired = rule_lib.fired(transits.active)
     if not fired and rule_lib.rules:
-        fd = rule_lib.rules[0]
-        fd.date_from = dasha.window_from
-        fd.date_to = dasha.window_to
-        fired = [fd]
+        fired = rule_lib.rules[:1]
+    fired = [replace(r, date_from=dasha.window_from, date_to=dasha.window_to) for r in fired]
 
-    phrased = [phrase_prediction(r, natal=natal, dasha=dasha, transits=transits, tone=b.tone) for r in fired]
+    phrased = phrase_predictions(fired, natal=natal, dasha=dasha, transits=transits, tone=b.tone)
     today = phrased[0]["message"] if phrased else "A calm day. Focus on basics."
     week = phrased[1]["message"] if len(phrased) > 1 else today
     key_dates = [{"from": r.date_from, "to": r.date_to, "theme": r.theme} for r in fired]
@@ -539,13 +594,11 @@ def predict(b: BirthPayload, request: Request):
 def predict_event(b: EventPayload, request: Request):
     try:
         # Normalize time to UTC
-        b.utc_iso = normalize_utc_iso(b)
+        utc_iso = normalize_utc_iso(b)
 
-        # Build natal & dasha
-        natal = compute_natal(b)
-        birth_jd = jd_from_datetime(natal.utc_birth_dt)
-        dasha = compute_vimshottari_dasha_for_birth(birth_jd)
-        subs = subdivide_vimshottari(dasha, levels=3)  # maha+antara+pratyantara
+        # Build natal & dasha (cached per birth)
+        natal, birth_jd, dasha = _birth_chart(utc_iso, b.latitude, b.longitude)
+        subs = _birth_subs(utc_iso, b.latitude, b.longitude)
 
         # Anchor/date logic
         if b.anchor_iso:
@@ -556,34 +609,45 @@ def predict_event(b: EventPayload, request: Request):
         anchor_jd = jd_from_datetime(anchor_dt)
         direction = (b.direction or "future").lower()
 
-        # Age floor
+        # Age floor, as the earliest allowed start_jd
         min_age = AGE_MIN.get(b.question, 16.0)
+        min_start_jd = birth_jd + min_age * 365.2425
 
-        # Filter by direction
+        # Filter by direction and apply the age floor at start_jd (still fine for past validations)
+        # in one pass. subs are in maha/antara/pratyantara order, not time order, and the sort below
+        # is stable, so this stays a scan.
         if direction == "future":
-            pool = [s for s in subs if s["end_iso"] > anchor_iso]
+            pool = [s for s in subs if s["end_jd"] > anchor_jd and s["start_jd"] >= min_start_jd]
         elif direction == "past":
-            pool = [s for s in subs if s["start_iso"] <= anchor_iso]
-        else:  # "nearest"
-            pool = subs[:]  # both sides
-
-        # Apply age floor at start_jd (still fine for past validations)
-        pool = [s for s in pool if age_years_at_jd(birth_jd, s["start_jd"]) >= min_age]
+            pool = [s for s in subs if s["start_jd"] <= anchor_jd and s["start_jd"] >= min_start_jd]
+        else:  # "nearest": both sides
+            pool = [s for s in subs if s["start_jd"] >= min_start_jd]
 
         if not pool:
             # last resort: drop age floor if nothing matches
-            pool = [s for s in subs if (direction != "future" or s["end_iso"] > anchor_iso)]
+            pool = [s for s in subs if (direction != "future" or s["end_jd"] > anchor_jd)]
             if not pool:
                 pool = subs
 
         # Rank by KP score, then closeness to anchor (days)
+        sig = planet_significators(natal)
+
         def days_from_anchor(sub):
             return abs(sub["start_jd"] - anchor_jd)
 
+        # A sub's score only depends on (level, lord, parent), so score each combination once
+        score_memo = {}
+        def score_of(sub):
+            k = (sub["level"], sub["lord"], sub.get("parent"))
+            sc = score_memo.get(k)
+            if sc is None:
+                sc = score_memo[k] = score_subperiod(sig, sub, b.question)
+            return sc
+
         ranked = sorted(
             pool,
             key=lambda s: (
-                -score_subperiod(natal, s, b.question),
+                -score_of(s),
                 days_from_anchor(s),
                 s["start_jd"]
             )
@@ -592,16 +656,13 @@ def predict_event(b: EventPayload, request: Request):
         # For a strict "past" request, prefer latest before anchor among top scored
         if direction == "past":
             # take best score among top 10, then latest by start_jd
-            top_score = score_subperiod(natal, ranked[0], b.question) if ranked else -1e9
-            close = [s for s in ranked if abs(score_subperiod(natal, s, b.question) - top_score) < 1e-6]
+            top_score = score_of(ranked[0]) if ranked else -1e9
+            close = [s for s in ranked if abs(score_of(s) - top_score) < 1e-6]
             chosen = max(close, key=lambda x: x["start_jd"]) if close else (ranked[0] if ranked else subs[0])
         else:
             chosen = ranked[0] if ranked else subs[0]
 
         # Format response
-        def _ym(iso):
-            dt = datetime.fromisoformat(iso.replace("Z","+00:00"))
-            return dt.year, dt.month
         ys, ms = _ym(chosen["start_iso"])
         ye, me = _ym(chosen["end_iso"])
         lord = chosen["lord"].title()
@@ -628,15 +689,15 @@ def predict_event(b: EventPayload, request: Request):
     except HTTPException as he:
         raise he
     except Exception as e:
-        return JSONResponse({"error": str(e)}, status_code=500)
+        return OrjsonResponse({"error": str(e)}, status_code=500)
 
 @app.post("/api/v1/predict_event_kp")
 def predict_event_kp(b: dict):
     try:
-        # build natal
-        birth = type("B", (), b)()
-        natal = compute_natal(birth)
-        pr = promise_score_for_event(natal, b.get("question","marriage"))
+        # build natal & dasha (cached per birth)
+        natal, jd, dasha = _birth_chart(b.get("utc_iso"), b.get("latitude"), b.get("longitude"))
+        sig = planet_significators(natal)  # shared by the promise check and the DBA scoring
+        pr = promise_score_for_event(natal, b.get("question","marriage"), sig=sig)
         if not pr["promised"]:
             return {
                 "question": b.get("question"),
@@ -645,15 +706,13 @@ def predict_event_kp(b: dict):
                 "diagnostics": pr
             }
 
-        # dasha & windows
-        jd = jd_from_datetime(natal.utc_birth_dt)
-        dasha = compute_vimshottari_dasha_for_birth(jd)
-
+        # windows
         rows = select_dba_windows(
             natal, dasha,
             b.get("question","marriage"),
             direction=b.get("direction","nearest"),
-            anchor_iso=b.get("anchor_iso")
+            anchor_iso=b.get("anchor_iso"),
+            sig=sig,
         )
 
         if not rows:
@@ -661,10 +720,8 @@ def predict_event_kp(b: dict):
 
         best = rows[0]
         win = best["praty"] or best["antara"] or best["maha"]
-        ys = datetime.fromisoformat(win["start_iso"].replace("Z","+00:00")).year
-        ms = datetime.fromisoformat(win["start_iso"].replace("Z","+00:00")).month
-        ye = datetime.fromisoformat(win["end_iso"].replace("Z","+00:00")).year
-        me = datetime.fromisoformat(win["end_iso"].replace("Z","+00:00")).month
+        ys, ms = _ym(win["start_iso"])
+        ye, me = _ym(win["end_iso"])
 
         import calendar
         return {
@@ -697,7 +754,7 @@ def predict_event_kp(b: dict):
             "diagnostics": pr
         }
     except Exception as e:
-        return JSONResponse({"error": str(e)}, status_code=500)
+        return OrjsonResponse({"error": str(e)}, status_code=500)
 
 
 @app.post("/debug/promise")
@@ -712,12 +769,11 @@ def debug_promise(payload: dict):
     }
     """
     try:
-        b = type("B", (), payload)()
-        natal = compute_natal(b)
+        natal = _birth_chart(payload.get("utc_iso"), payload.get("latitude"), payload.get("longitude"))[0]
         out = promise_score_for_event(natal, payload.get("event","marriage"))
         return out
     except Exception as e:
-        return JSONResponse({"error": str(e)}, status_code=500)
+        return OrjsonResponse({"error": str(e)}, status_code=500)
 
 @app.get("/debug/backtest_csv")
 def backtest_csv():
@@ -1,11 +1,20 @@
-from typing import Dict
+from typing import Dict, List
 from app.astrology.rules import Rule
 
+_TONE_SUFFIX = {"Playful": " Enjoy the positive momentum.", "Spiritual": " Trust the timing and stay centered."}
+
 def phrase_prediction(rule: Rule, natal, dasha, transits, tone: str = "Friendly") -> Dict[str, str]:
-    msg = rule.message
-    if tone == "Neutral": msg = msg.replace("!", ".")
-    elif tone == "Playful": msg += " Enjoy the positive momentum."
-    elif tone == "Spiritual": msg += " Trust the timing and stay centered."
-    if getattr(rule, "date_from", None): msg = msg.replace("{from}", rule.date_from)
-    if getattr(rule, "date_to", None): msg = msg.replace("{to}", rule.date_to)
-    return {"id": rule.id, "theme": rule.theme, "message": msg, "from": rule.date_from, "to": rule.date_to}
+    return phrase_predictions([rule], natal=natal, dasha=dasha, transits=transits, tone=tone)[0]
+
+def phrase_predictions(rules: List[Rule], natal, dasha, transits, tone: str = "Friendly") -> List[Dict[str, str]]:
+    # Tone is resolved once for the whole batch
+    neutral, suffix = tone == "Neutral", _TONE_SUFFIX.get(tone, "")
+    out = []
+    for rule in rules:
+        msg = rule.message
+        if neutral: msg = msg.replace("!", ".")
+        elif suffix: msg += suffix
+        if getattr(rule, "date_from", None): msg = msg.replace("{from}", rule.date_from)
+        if getattr(rule, "date_to", None): msg = msg.replace("{to}", rule.date_to)
+        out.append({"id": rule.id, "theme": rule.theme, "message": msg, "from": rule.date_from, "to": rule.date_to})
+    return out